@@ -2,19 +2,93 @@
 
 from __future__ import annotations
 
-import json
+import io
 import os
-from collections.abc import Mapping, MutableMapping
+import sys
 from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
 
 from pydantic import BaseModel
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # cov: ignore
+    from json import loads as json_loads
+
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from typing_extensions import Self
 
-EventTypeVar = TypeVar("EventTypeVar", BaseModel, Mapping[str, Any], MutableMapping[str, Any])
+EventTypeVar = TypeVar("EventTypeVar", bound="BaseModel | Mapping[str, Any]")
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_API_URL = sys.intern("https://api.github.com")
+"""Default URL of the GitHub REST API."""
+
+_GRAPHQL_URL = sys.intern("https://api.github.com/graphql")
+"""Default URL of the GitHub GraphQL API."""
+
+_SERVER_URL = sys.intern("https://github.com")
+"""Default URL of the GitHub server."""
+
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "True", "TRUE", "yes", "Yes", "YES"})
+"""Values of an environment variable that are considered to be ``True``."""
+
+_AS_DICT_ATTRS: tuple[str, ...] = (
+    "action",
+    "action_path",
+    "action_ref",
+    "action_repository",
+    "actor",
+    "api_url",
+    "base_ref",
+    "event_name",
+    "event_path",
+    "graphql_url",
+    "head_ref",
+    "issue",
+    "job",
+    "ref",
+    "ref_name",
+    "ref_protected",
+    "ref_type",
+    "repository",
+    "repository_url",
+    "server_url",
+    "sha",
+    "triggering_actor",
+    "workflow",
+    "workflow_ref",
+    "workflow_sha",
+    "workspace",
+)
+"""Properties of :class:`~ghactions.toolkit.GithubContext` included in its ``as_dict()``."""
+
+_AS_DICT_GETTER = attrgetter(*_AS_DICT_ATTRS)
+"""Get the values of :data:`_AS_DICT_ATTRS` from an object in one call."""
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read the contents of a file as :class:`bytes`.
+
+    Uses the low-level file descriptor API to avoid the buffered/text IO layers
+    that :meth:`pathlib.Path.read_bytes` would set up.
+
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # st_size can be 0 (e.g. pipes, procfs) and os.read may return less than requested
+        size = os.fstat(fd).st_size or io.DEFAULT_BUFFER_SIZE
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, size):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
 
 
 class GitHubContextIssue(NamedTuple):
@@ -26,7 +100,7 @@ class GitHubContextIssue(NamedTuple):
     repo: str
     """Name of the repository."""
 
-    number: str
+    number: int
     """Issue number."""
 
 
@@ -47,11 +121,17 @@ class GithubContext(Generic[EventTypeVar]):
 
     """
 
-    _payload: dict[str, Any]
-    """Raw payload."""
+    _event_data: bytes | None
+    """Contents of the event file, if it has already been read but not yet parsed."""
 
     env: dict[str, str]
-    """Environment variables."""
+    """Environment variables.
+
+    If not provided when the object is created, this is a copy of :data:`os.environ`
+    that belongs to this instance alone; it is not shared with other instances and
+    does not reflect later changes to :data:`os.environ`.
+
+    """
 
     event: EventTypeVar
     """Event that triggered the workflow.
@@ -75,16 +155,31 @@ class GithubContext(Generic[EventTypeVar]):
             event_path: Manually specificy the path to the event file that was loaded.
 
         """
-        self._event_path = event_path
-        self.env = environ or os.environ.copy()
+        self.env = environ if environ is not None else os.environ.copy()
         self.event = event
+        env_event_path = self.env.get("GITHUB_EVENT_PATH")
+        self._event_path = event_path or (Path(env_event_path) if env_event_path else None)
+        self._event_data = None
 
-        if self.event_path and self.event_path.is_file():
-            self._payload = json.loads(self.event_path.read_text())
-        else:
-            self._payload = {}
+    @cached_property
+    def _payload(self) -> dict[str, Any]:
+        """Raw payload.
 
-    @property
+        Loaded from :attr:`event_path` on first access, reusing the contents of
+        the file if they were already read by one of the ``from_file*`` methods.
+
+        """
+        if self._event_data is not None:
+            data, self._event_data = self._event_data, None
+            return json_loads(data)
+        if not self.event_path:
+            return {}
+        try:
+            return json_loads(_read_bytes(self.event_path))
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return {}
+
+    @cached_property
     def action(self) -> str:
         """The name of the action currently running, or the id of a step (from environment variables).
 
@@ -96,7 +191,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_ACTION", "")
 
-    @property
+    @cached_property
     def action_path(self) -> Path | None:
         """The path where an action is located (from environment variables).
 
@@ -107,27 +202,27 @@ class GithubContext(Generic[EventTypeVar]):
         value = self.env.get("GITHUB_ACTION_PATH")
         return Path(value) if value else None
 
-    @property
+    @cached_property
     def action_ref(self) -> str | None:
         """For a step executing an action, this is the ref of the action being executed."""
         return self.env.get("GITHUB_ACTION_REF")
 
-    @property
+    @cached_property
     def action_repository(self) -> str | None:
         """For a step executing an action, this is the owner and repository name of the action."""
         return self.env.get("GITHUB_ACTION_REPOSITORY")
 
-    @property
+    @cached_property
     def actor(self) -> str:
         """The username of the user that triggered the initial workflow run (from environment variables)."""
         return self.env.get("GITHUB_ACTOR", "")
 
-    @property
+    @cached_property
     def api_url(self) -> str:
         """The URL of the GitHub REST API (from environment variables)."""
-        return self.env.get("GITHUB_API_URL", "https://api.github.com")
+        return self.env.get("GITHUB_API_URL", _API_URL)
 
-    @property
+    @cached_property
     def base_ref(self) -> str | None:
         """The ``base_ref`` or target branch of the pull request in a workflow run (from environment variables).
 
@@ -137,7 +232,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_BASE_REF")
 
-    @property
+    @cached_property
     def event_name(self) -> str:
         """The name of the event that triggered the workflow run (from environment variables)."""
         return self.env.get("GITHUB_EVENT_NAME", "")
@@ -145,15 +240,14 @@ class GithubContext(Generic[EventTypeVar]):
     @property
     def event_path(self) -> Path | None:
         """The path to the file on the runner that contains the full event webhook payload ."""
-        value = self._event_path or self.env.get("GITHUB_EVENT_PATH")
-        return Path(value) if value else None
+        return self._event_path
 
-    @property
+    @cached_property
     def graphql_url(self) -> str:
         """The URL of the GitHub GraphQL API (from environment variables)."""
-        return self.env.get("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+        return self.env.get("GITHUB_GRAPHQL_URL", _GRAPHQL_URL)
 
-    @property
+    @cached_property
     def head_ref(self) -> str | None:
         """The ``head_ref`` or source branch of the pull request in a workflow run (from environment variables).
 
@@ -170,9 +264,9 @@ class GithubContext(Generic[EventTypeVar]):
         number = payload.get("number")
         if not number or not self.repository:
             return None
-        return GitHubContextIssue(self.repository.owner, self.repository.name, number)
+        return GitHubContextIssue(self.repository.owner, self.repository.name, int(number))
 
-    @property
+    @cached_property
     def job(self) -> str | None:
         """The ``job_id`` of the current job (from environment variables).
 
@@ -184,7 +278,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_JOB")
 
-    @property
+    @cached_property
     def ref(self) -> str:
         """The fully-formed ref of the branch or tag that triggered the workflow run (from environment variables).
 
@@ -201,7 +295,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_REF", "")
 
-    @property
+    @cached_property
     def ref_name(self) -> str:
         """The short ref name of the branch or tag that triggered the workflow run (from environment variables).
 
@@ -211,12 +305,12 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_REF_NAME", "")
 
-    @property
+    @cached_property
     def ref_protected(self) -> bool:
         """If branch protections or rulesets are configured for the ref that triggered the workflow."""
-        return self.env.get("GITHUB_REF_PROTECTED", "").lower() in ("1", "true")
+        return self.env.get("GITHUB_REF_PROTECTED", "") in _TRUTHY
 
-    @property
+    @cached_property
     def ref_type(self) -> str:
         """The type of ref that triggered the workflow run (from environment variables).
 
@@ -228,15 +322,16 @@ class GithubContext(Generic[EventTypeVar]):
     @cached_property
     def repository(self) -> GitHubContextRepo | None:
         """GitHub Repository."""
-        repo = self.env.get("GITHUB_REPOSITORY")
-        if self.env.get("GITHUB_REPOSITORY"):
-            return GitHubContextRepo(*self.env["GITHUB_REPOSITORY"].split("/"))
+        env_repo = self.env.get("GITHUB_REPOSITORY")
+        if env_repo:
+            owner, _, name = env_repo.partition("/")
+            return GitHubContextRepo(owner, name)
         repo = self._payload.get("repository")
         if not repo:
             return None
         return GitHubContextRepo(repo["owner"]["login"], repo["name"])
 
-    @property
+    @cached_property
     def repository_url(self) -> str | None:
         """The Git URL to the repository (from environment variables)."""
         return (
@@ -245,12 +340,12 @@ class GithubContext(Generic[EventTypeVar]):
             else None
         )
 
-    @property
+    @cached_property
     def server_url(self) -> str:
         """The URL of the GitHub server (from environment variables)."""
-        return self.env.get("GITHUB_SERVER_URL", "https://github.com")
+        return self.env.get("GITHUB_SERVER_URL", _SERVER_URL)
 
-    @property
+    @cached_property
     def sha(self) -> str:
         """The commit SHA that triggered the workflow (from environment variables).
 
@@ -259,7 +354,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_SHA", "")
 
-    @property
+    @cached_property
     def token(self) -> str:
         """A token to authenticate on behalf of the GitHub App installed on your repository.
 
@@ -268,12 +363,12 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_TOKEN", "")
 
-    @property
+    @cached_property
     def triggering_actor(self) -> str:
         """The username of the user that initiated the workflow run (from environment variables)."""
         return self.env.get("GITHUB_TRIGGERING_ACTOR", "")
 
-    @property
+    @cached_property
     def workflow(self) -> str:
         """The name of the workflow (from environment variables).
 
@@ -283,7 +378,7 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_WORKFLOW", "")
 
-    @property
+    @cached_property
     def workflow_ref(self) -> str:
         """The ref path to the workflow (from environment variables).
 
@@ -292,12 +387,12 @@ class GithubContext(Generic[EventTypeVar]):
         """
         return self.env.get("GITHUB_WORKFLOW_REF", "")
 
-    @property
+    @cached_property
     def workflow_sha(self) -> str:
         """The commit SHA for the workflow file (from environment variables)."""
         return self.env.get("GITHUB_WORKFLOW_SHA", "")
 
-    @property
+    @cached_property
     def workspace(self) -> Path:
         """The default working directory on the runner for steps (from environment variables).
 
@@ -307,6 +402,16 @@ class GithubContext(Generic[EventTypeVar]):
         value = self.env.get("GITHUB_WORKSPACE")
         return Path(value) if value else Path.cwd()
 
+    def as_dict(self) -> dict[str, Any]:
+        """Get the values of all properties as a :class:`dict`.
+
+        Values are read through the (cached) properties using a precompiled
+        :func:`operator.attrgetter`.
+        :attr:`token` is intentionally excluded so the result is safe to log.
+
+        """
+        return dict(zip(_AS_DICT_ATTRS, _AS_DICT_GETTER(self), strict=True))
+
     @classmethod
     def from_file(
         cls: type[Self],
@@ -321,9 +426,134 @@ class GithubContext(Generic[EventTypeVar]):
             event_path: Path to the JSON file containing the event.
 
         """
-        if not event_path:
-            event_path = os.getenv("GITHUB_EVENT_PATH", "")
-        event_path = Path(event_path) if not isinstance(event_path, Path) else event_path
-        if not event_path.is_file():
-            raise FileNotFoundError(event_path)
-        return cls(environ=environ, event=json.loads(event_path.read_text()), event_path=event_path)
+        event_path, data = cls._read_event_file(event_path, environ)
+        ctx = cls(environ=environ, event=json_loads(data), event_path=event_path)
+        ctx._event_data = data  # noqa: SLF001
+        return ctx
+
+    @classmethod
+    def from_file_msgspec(
+        cls: type[GithubContext[Any]],
+        *,
+        environ: dict[str, str] | None = None,
+        event_path: Path | str | None = None,
+    ) -> GithubContext[dict[str, Any]]:
+        """Load event from a file, decoding it with `msgspec <https://jcristharif.com/msgspec/>`__.
+
+        Behaves the same as :meth:`from_file` but uses :func:`msgspec.json.decode`
+        which is typically the fastest way to load the event into a :class:`dict`.
+        Requires the ``msgspec`` extra to be installed (e.g. ``pip install ghactions[msgspec]``).
+
+        Args:
+            environ: Environment variables.
+            event_path: Path to the JSON file containing the event.
+
+        Raises:
+            ModuleNotFoundError: ``msgspec`` is not installed.
+
+        """
+        import msgspec.json
+
+        event_path, data = cls._read_event_file(event_path, environ)
+        ctx = cls(environ=environ, event=msgspec.json.decode(data), event_path=event_path)
+        ctx._event_data = data  # noqa: SLF001
+        return ctx
+
+    @classmethod
+    def from_file_typed(
+        cls: type[GithubContext[Any]],
+        model: type[_ModelT],
+        *,
+        environ: dict[str, str] | None = None,
+        event_path: Path | str | None = None,
+    ) -> GithubContext[_ModelT]:
+        """Load event from a file into a model without validating it.
+
+        The event is created using :meth:`pydantic.BaseModel.model_construct`
+        so the validation pass is skipped entirely.
+        This should only be used for a trusted source (e.g. the file found at
+        ``GITHUB_EVENT_PATH`` that was written by GitHub) where the payload is
+        known to conform to the model.
+        Nested models are not constructed and remain as their raw JSON values.
+
+        Args:
+            model: Model that the event will be loaded into.
+            environ: Environment variables.
+            event_path: Path to the JSON file containing the event.
+
+        """
+        event_path, data = cls._read_event_file(event_path, environ)
+        ctx = cls(
+            environ=environ,
+            event=model.model_construct(**json_loads(data)),
+            event_path=event_path,
+        )
+        ctx._event_data = data  # noqa: SLF001
+        return ctx
+
+    @classmethod
+    def from_file_validated(
+        cls: type[GithubContext[Any]],
+        model: type[_ModelT],
+        *,
+        environ: dict[str, str] | None = None,
+        event_path: Path | str | None = None,
+    ) -> GithubContext[_ModelT]:
+        """Load event from a file into a model, validating it.
+
+        The contents of the file are passed directly to
+        :meth:`pydantic.BaseModel.model_validate_json` so the JSON is parsed and
+        validated in a single pass without creating an intermediate :class:`dict`.
+        Unlike :meth:`from_file_typed`, nested models are constructed and invalid
+        payloads are rejected, at the cost of running validation.
+
+        Args:
+            model: Model that the event will be loaded into.
+            environ: Environment variables.
+            event_path: Path to the JSON file containing the event.
+
+        Raises:
+            pydantic.ValidationError: The event does not conform to the model.
+
+        """
+        event_path, data = cls._read_event_file(event_path, environ)
+        ctx = cls(
+            environ=environ,
+            event=model.model_validate_json(data),
+            event_path=event_path,
+        )
+        ctx._event_data = data  # noqa: SLF001
+        return ctx
+
+    @staticmethod
+    def _read_event_file(
+        event_path: Path | str | None = None, environ: dict[str, str] | None = None
+    ) -> tuple[Path, bytes]:
+        """Resolve the path to the event file and read its contents.
+
+        Args:
+            event_path: Path to the JSON file containing the event.
+                If not provided, the value of ``GITHUB_EVENT_PATH`` is used.
+            environ: Environment variables to get ``GITHUB_EVENT_PATH`` from.
+
+        Returns:
+            The resolved path to the event file and its contents.
+
+        Raises:
+            FileNotFoundError: The event file does not exist.
+
+        """
+        event_path = Path(
+            event_path
+            or (environ if environ is not None else os.environ).get("GITHUB_EVENT_PATH")
+            or ""
+        )
+        try:
+            return event_path, _read_bytes(event_path)
+        except (IsADirectoryError, NotADirectoryError) as exc:
+            raise FileNotFoundError(event_path) from exc
+        except PermissionError as exc:
+            # on Windows, opening a directory raises PermissionError
+            if event_path.is_dir():
+                raise FileNotFoundError(event_path) from exc
+            raise
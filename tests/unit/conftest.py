@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
+    from collections.abc import Iterator
 
 ENV_OVERRIDE: dict[str, str] = {
     "GITHUB_ACTION": "test-action",
@@ -40,8 +40,26 @@ ENV_REMOVE = (
 
 
 @pytest.fixture(autouse=True, scope="session")
-def environ(session_mocker: MockerFixture) -> dict[str, str]:
-    """Patch ``os.environ``."""
-    values = os.environ.copy()
-    values.update(ENV_OVERRIDE)
-    return session_mocker.patch.dict(os.environ, values, clear=True)
+def patch_os_environ() -> Iterator[dict[str, str]]:
+    """Apply :data:`ENV_OVERRIDE` and :data:`ENV_REMOVE` to ``os.environ`` for the session.
+
+    The original values are restored when the session ends.
+
+    """
+    original = dict(os.environ)
+    values = {k: v for k, v in original.items() if k not in ENV_REMOVE} | ENV_OVERRIDE
+    os.environ.clear()
+    os.environ.update(values)
+    yield values
+    os.environ.clear()
+    os.environ.update(original)
+
+
+@pytest.fixture()
+def environ(patch_os_environ: dict[str, str]) -> dict[str, str]:
+    """Environment variables to pass to :class:`~ghactions.toolkit.GithubContext`.
+
+    A new :class:`dict` is created for each test so it can be safely modified.
+
+    """
+    return patch_os_environ.copy()
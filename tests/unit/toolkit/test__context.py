@@ -3,20 +3,78 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from pydantic import BaseModel, ValidationError
 
-from ghactions.toolkit._context import GithubContext, GitHubContextIssue, GitHubContextRepo
+from ghactions.toolkit._context import (
+    GithubContext,
+    GitHubContextIssue,
+    GitHubContextRepo,
+    _read_bytes,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
 
     from pytest_mock import MockerFixture
 
 
 MODULE = "ghactions.toolkit._context"
 
+SIMPLE_PROPS: list[tuple[str, str, str | None]] = [
+    ("GITHUB_ACTION", "action", ""),
+    ("GITHUB_ACTION_REF", "action_ref", None),
+    ("GITHUB_ACTION_REPOSITORY", "action_repository", None),
+    ("GITHUB_ACTOR", "actor", ""),
+    ("GITHUB_API_URL", "api_url", "https://api.github.com"),
+    ("GITHUB_BASE_REF", "base_ref", None),
+    ("GITHUB_EVENT_NAME", "event_name", ""),
+    ("GITHUB_GRAPHQL_URL", "graphql_url", "https://api.github.com/graphql"),
+    ("GITHUB_HEAD_REF", "head_ref", None),
+    ("GITHUB_JOB", "job", None),
+    ("GITHUB_REF", "ref", ""),
+    ("GITHUB_REF_NAME", "ref_name", ""),
+    ("GITHUB_REF_TYPE", "ref_type", "branch"),
+    ("GITHUB_SERVER_URL", "server_url", "https://github.com"),
+    ("GITHUB_SHA", "sha", ""),
+    ("GITHUB_TOKEN", "token", ""),
+    ("GITHUB_TRIGGERING_ACTOR", "triggering_actor", ""),
+    ("GITHUB_WORKFLOW", "workflow", ""),
+    ("GITHUB_WORKFLOW_REF", "workflow_ref", ""),
+    ("GITHUB_WORKFLOW_SHA", "workflow_sha", ""),
+]
+"""Properties that return an environment variable as-is: ``(env_key, attr, default)``."""
+
+
+class PushEvent(BaseModel):
+    """Partial push event used for testing."""
+
+    after: str
+    forced: bool
+    ref: str
+
+
+def test__read_bytes(tmp_path: Path) -> None:
+    """Test _read_bytes."""
+    path = tmp_path / "test.json"
+    path.write_bytes(b'{"name": "foo"}')
+    assert _read_bytes(path) == b'{"name": "foo"}'
+
+
+@pytest.mark.parametrize("st_size", [0, 2])
+def test__read_bytes_size_mismatch(mocker: MockerFixture, st_size: int, tmp_path: Path) -> None:
+    """Test _read_bytes reads until EOF when the reported size is not the full size."""
+    path = tmp_path / "test.json"
+    path.write_bytes(b'{"name": "foo"}')
+    mocker.patch(f"{MODULE}.os.fstat", return_value=SimpleNamespace(st_size=st_size))
+    assert _read_bytes(path) == b'{"name": "foo"}'
+
 
 class TestGithubContext:
     """Test GithubContext."""
@@ -24,11 +82,18 @@ class TestGithubContext:
     def test___init__(self, environ: dict[str, str]) -> None:
         """Test __init__."""
         environ.pop("GITHUB_EVENT_PATH", "")
-        ctx = GithubContext(event={"name": "foo"})
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
         assert ctx.env == environ
         assert ctx.event == {"name": "foo"}
         assert ctx._payload == {}
 
+    def test___init___os_environ(self) -> None:
+        """Test __init__ copies os.environ for each instance."""
+        ctx = GithubContext(event={"name": "foo"})
+        assert ctx.env == os.environ
+        assert ctx.env is not os.environ
+        assert ctx.env is not GithubContext(event={"name": "bar"}).env
+
     def test___init___payload(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
         """Test __init__ with payload."""
         payload_path = test_fixture_dir / "events" / "push.json"
@@ -38,22 +103,34 @@ class TestGithubContext:
         assert ctx.event == {"name": "foo"}
         assert ctx._payload == json.loads(payload_path.read_text())
 
-    def test___init___payload_not_found(self, environ: dict[str, str], tmp_path: Path) -> None:
+    def test___init___payload_lazy(self, environ: dict[str, str], mocker: MockerFixture) -> None:
+        """Test __init__ does not load the payload."""
+        mock_read_bytes = mocker.patch(f"{MODULE}._read_bytes")
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        assert "_payload" not in vars(ctx)
+        mock_read_bytes.assert_not_called()
+
+    @pytest.mark.parametrize("event_file", ["", "missing.json", "file.json/missing.json"])
+    def test___init___payload_not_found(
+        self, environ: dict[str, str], event_file: str, tmp_path: Path
+    ) -> None:
         """Test __init__ with payload."""
-        environ["GITHUB_EVENT_PATH"] = str(tmp_path)
+        (tmp_path / "file.json").touch()
+        environ["GITHUB_EVENT_PATH"] = str(tmp_path / event_file)
         ctx = GithubContext(environ=environ, event={"name": "foo"})
         assert ctx.env == environ
         assert ctx.event == {"name": "foo"}
         assert ctx._payload == {}
 
-    @pytest.mark.parametrize("action", ["", "test"])
-    def test_action(self, action: str, environ: dict[str, str]) -> None:
-        """Test action."""
-        if not action:
-            environ.pop("GITHUB_ACTION", "")
-        else:
-            environ["GITHUB_ACTION"] = action
-        assert GithubContext(environ=environ, event={"name": "foo"}).action == action
+    def test___init___payload_permission_error(
+        self, environ: dict[str, str], mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test __init__ with payload that can't be read."""
+        mocker.patch(f"{MODULE}._read_bytes", side_effect=PermissionError)
+        environ["GITHUB_EVENT_PATH"] = str(tmp_path / "event.json")
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        with pytest.raises(PermissionError):
+            _ = ctx._payload
 
     def test_action_path(self, environ: dict[str, str], tmp_path: Path) -> None:
         """Test action_path."""
@@ -65,68 +142,54 @@ class TestGithubContext:
         environ.pop("GITHUB_ACTION_PATH", None)
         assert not GithubContext(environ=environ, event={"name": "foo"}).action_path
 
-    @pytest.mark.parametrize("action_ref", [None, "test"])
-    def test_action_ref(self, action_ref: str | None, environ: dict[str, str]) -> None:
-        """Test action_ref."""
-        if not action_ref:
-            environ.pop("GITHUB_ACTION_REF", "")
-        else:
-            environ["GITHUB_ACTION_REF"] = action_ref
-        assert GithubContext(environ=environ, event={"name": "foo"}).action_ref == action_ref
+    def test_as_dict(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
+        """Test as_dict."""
+        environ["GITHUB_EVENT_PATH"] = str(test_fixture_dir / "events" / "push.json")
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        result = ctx.as_dict()
+        assert "token" not in result
+        assert result == {
+            attr: getattr(ctx, attr)
+            for attr in [
+                *(attr for _, attr, _ in SIMPLE_PROPS if attr != "token"),
+                "action_path",
+                "event_path",
+                "issue",
+                "ref_protected",
+                "repository",
+                "repository_url",
+                "workspace",
+            ]
+        }
+
+    def test_as_dict_cached(self, environ: dict[str, str]) -> None:
+        """Test as_dict uses the cached property values."""
+        environ["GITHUB_ACTION"] = "test"
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        assert ctx.action == "test"
+        ctx.env["GITHUB_ACTION"] = "changed"
+        assert ctx.as_dict()["action"] == ctx.action == "test"
 
-    @pytest.mark.parametrize("action_repository", [None, "test"])
-    def test_action_repository(
-        self,
-        action_repository: str | None,
-        environ: dict[str, str],
+    def test_cached(self, environ: dict[str, str]) -> None:
+        """Test environment derived properties are only resolved once."""
+        environ["GITHUB_ACTION"] = "test"
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        assert ctx.action == "test"
+        ctx.env["GITHUB_ACTION"] = "changed"
+        assert ctx.action == "test"
+
+    @pytest.mark.parametrize("value", [None, "test"])
+    @pytest.mark.parametrize(("key", "attr", "default"), SIMPLE_PROPS)
+    def test_env_property(
+        self, attr: str, default: str | None, environ: dict[str, str], key: str, value: str | None
     ) -> None:
-        """Test action_repository."""
-        if not action_repository:
-            environ.pop("GITHUB_ACTION_REPOSITORY", "")
+        """Test properties that return an environment variable as-is."""
+        if value is None:
+            environ.pop(key, None)
         else:
-            environ["GITHUB_ACTION_REPOSITORY"] = action_repository
-        assert (
-            GithubContext(environ=environ, event={"name": "foo"}).action_repository
-            == action_repository
-        )
-
-    @pytest.mark.parametrize("actor", ["", "test"])
-    def test_actor(self, actor: str, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not actor:
-            environ.pop("GITHUB_ACTOR", "")
-        else:
-            environ["GITHUB_ACTOR"] = actor
-        assert GithubContext(environ=environ, event={"name": "foo"}).actor == actor
-
-    @pytest.mark.parametrize("api_url", ["", "test"])
-    def test_api_url(self, api_url: str, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not api_url:
-            environ.pop("GITHUB_API_URL", "")
-        else:
-            environ["GITHUB_API_URL"] = api_url
-        assert GithubContext(environ=environ, event={"name": "foo"}).api_url == (
-            api_url or "https://api.github.com"
-        )
-
-    @pytest.mark.parametrize("base_ref", [None, "test"])
-    def test_base_ref(self, base_ref: str | None, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not base_ref:
-            environ.pop("GITHUB_BASE_REF", "")
-        else:
-            environ["GITHUB_BASE_REF"] = base_ref
-        assert GithubContext(environ=environ, event={"name": "foo"}).base_ref == base_ref
-
-    @pytest.mark.parametrize("event_name", ["", "test"])
-    def test_event_name(self, event_name: str, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not event_name:
-            environ.pop("GITHUB_EVENT_NAME", "")
-        else:
-            environ["GITHUB_EVENT_NAME"] = event_name
-        assert GithubContext(environ=environ, event={"name": "foo"}).event_name == event_name
+            environ[key] = value
+        ctx = GithubContext(environ=environ, event={"name": "foo"})
+        assert getattr(ctx, attr) == (default if value is None else value)
 
     def test_event_path(self, environ: dict[str, str], tmp_path: Path) -> None:
         """Test event_path."""
@@ -138,10 +201,21 @@ class TestGithubContext:
         environ.pop("GITHUB_EVENT_PATH", None)
         assert not GithubContext(environ=environ, event={"name": "foo"}).event_path
 
+    def test_event_path_provided(self, environ: dict[str, str], tmp_path: Path) -> None:
+        """Test event_path provided to __init__ takes precedence over the environment."""
+        environ["GITHUB_EVENT_PATH"] = str(tmp_path / "env.json")
+        event_path = tmp_path / "event.json"
+        assert (
+            GithubContext(environ=environ, event={"name": "foo"}, event_path=event_path).event_path
+            == event_path
+        )
+
     def test_from_file(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
         """Test from_file."""
         event_path = test_fixture_dir / "events" / "push.json"
-        ctx: GithubContext[dict[str, str]] = GithubContext.from_file(event_path=event_path)
+        ctx: GithubContext[dict[str, str]] = GithubContext.from_file(
+            environ=environ, event_path=event_path
+        )
         assert ctx.env == environ
         assert ctx.event == json.loads(event_path.read_text())
         assert ctx.event_path == event_path
@@ -155,46 +229,132 @@ class TestGithubContext:
         assert ctx.event == json.loads(event_path.read_text())
         assert ctx.event_path == event_path
 
+    @pytest.mark.parametrize(
+        "loader",
+        [
+            GithubContext.from_file,
+            GithubContext.from_file_msgspec,
+            partial(GithubContext.from_file_typed, PushEvent),
+            partial(GithubContext.from_file_validated, PushEvent),
+        ],
+    )
+    def test_from_file_payload_reuses_data(
+        self,
+        environ: dict[str, str],
+        loader: Callable[..., GithubContext[Any]],
+        mocker: MockerFixture,
+        test_fixture_dir: Path,
+    ) -> None:
+        """Test the payload is parsed from the data already read by from_file*."""
+        event_path = test_fixture_dir / "events" / "push.json"
+        ctx = loader(environ=environ, event_path=event_path)
+        mock_read_bytes = mocker.patch(f"{MODULE}._read_bytes")
+        assert ctx._payload == json.loads(event_path.read_text())
+        mock_read_bytes.assert_not_called()
+        assert ctx._event_data is None
+
+    def test_from_file_msgspec(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
+        """Test from_file_msgspec."""
+        event_path = test_fixture_dir / "events" / "push.json"
+        ctx = GithubContext.from_file_msgspec(environ=environ, event_path=event_path)
+        assert ctx.env == environ
+        assert ctx.event == json.loads(event_path.read_text())
+        assert ctx.event_path == event_path
+
     def test_from_file_not_found(self, environ: dict[str, str]) -> None:
         """Test from_file raise FileNotFoundError."""
         environ.pop("GITHUB_EVENT_PATH", None)
         with pytest.raises(FileNotFoundError):
             GithubContext.from_file(environ=environ)
 
-    @pytest.mark.parametrize("graphql_url", ["", "test"])
-    def test_graphql_url(self, graphql_url: str, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not graphql_url:
-            environ.pop("GITHUB_GRAPHQL_URL", "")
-        else:
-            environ["GITHUB_GRAPHQL_URL"] = graphql_url
-        assert GithubContext(environ=environ, event={"name": "foo"}).graphql_url == (
-            graphql_url or "https://api.github.com/graphql"
-        )
+    def test_from_file_not_found_missing(self, environ: dict[str, str], tmp_path: Path) -> None:
+        """Test from_file raise FileNotFoundError when the file does not exist."""
+        with pytest.raises(FileNotFoundError):
+            GithubContext.from_file(environ=environ, event_path=tmp_path / "missing.json")
 
-    @pytest.mark.parametrize("head_ref", [None, "test"])
-    def test_head_ref(self, head_ref: str | None, environ: dict[str, str]) -> None:
-        """Test actor."""
-        if not head_ref:
-            environ.pop("GITHUB_HEAD_REF", "")
-        else:
-            environ["GITHUB_HEAD_REF"] = head_ref
-        assert GithubContext(environ=environ, event={"name": "foo"}).head_ref == head_ref
+    def test_from_file_not_found_not_a_directory(
+        self, environ: dict[str, str], tmp_path: Path
+    ) -> None:
+        """Test from_file raise FileNotFoundError when a parent is not a directory."""
+        (tmp_path / "file.json").touch()
+        with pytest.raises(FileNotFoundError):
+            GithubContext.from_file(
+                environ=environ, event_path=tmp_path / "file.json" / "missing.json"
+            )
+
+    def test_from_file_not_found_permission_error_directory(
+        self, environ: dict[str, str], mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test from_file raise FileNotFoundError when opening a directory raises PermissionError."""
+        mocker.patch(f"{MODULE}._read_bytes", side_effect=PermissionError)
+        with pytest.raises(FileNotFoundError):
+            GithubContext.from_file(environ=environ, event_path=tmp_path)
+
+    def test_from_file_permission_error(
+        self, environ: dict[str, str], mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test from_file raise PermissionError when a file can't be read."""
+        mocker.patch(f"{MODULE}._read_bytes", side_effect=PermissionError)
+        with pytest.raises(PermissionError):
+            GithubContext.from_file(environ=environ, event_path=tmp_path / "event.json")
+
+    def test_from_file_typed(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
+        """Test from_file_typed."""
+        event_path = test_fixture_dir / "events" / "push.json"
+        payload = json.loads(event_path.read_text())
+        ctx = GithubContext.from_file_typed(PushEvent, environ=environ, event_path=event_path)
+        assert ctx.event.ref == payload["ref"]
+        assert ctx.event.forced is payload["forced"]
+        assert ctx.event_path == event_path
+
+    def test_from_file_typed_not_validated(self, environ: dict[str, str], tmp_path: Path) -> None:
+        """Test from_file_typed does not validate the event."""
+        event_path = tmp_path / "event.json"
+        event_path.write_text(json.dumps({"forced": "not-a-bool"}))
+        ctx = GithubContext.from_file_typed(PushEvent, environ=environ, event_path=event_path)
+        assert ctx.event.forced == "not-a-bool"
+
+    def test_from_file_typed_not_found(self, environ: dict[str, str]) -> None:
+        """Test from_file_typed raise FileNotFoundError."""
+        environ.pop("GITHUB_EVENT_PATH", None)
+        with pytest.raises(FileNotFoundError):
+            GithubContext.from_file_typed(PushEvent, environ=environ)
+
+    def test_from_file_validated(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
+        """Test from_file_validated."""
+        event_path = test_fixture_dir / "events" / "push.json"
+        ctx = GithubContext.from_file_validated(PushEvent, environ=environ, event_path=event_path)
+        assert ctx.event == PushEvent.model_validate(json.loads(event_path.read_text()))
+        assert ctx.event_path == event_path
+
+    def test_from_file_validated_invalid(self, environ: dict[str, str], tmp_path: Path) -> None:
+        """Test from_file_validated raise ValidationError."""
+        event_path = tmp_path / "event.json"
+        event_path.write_text(json.dumps({"forced": "not-a-bool"}))
+        with pytest.raises(ValidationError):
+            GithubContext.from_file_validated(PushEvent, environ=environ, event_path=event_path)
+
+    def test_from_file_validated_not_found(self, environ: dict[str, str]) -> None:
+        """Test from_file_validated raise FileNotFoundError."""
+        environ.pop("GITHUB_EVENT_PATH", None)
+        with pytest.raises(FileNotFoundError):
+            GithubContext.from_file_validated(PushEvent, environ=environ)
 
     @pytest.mark.parametrize(
         ("event", "expected"),
         [
             ({}, None),
-            ({"number": "9"}, "9"),
-            ({"issue": {"number": "9"}}, "9"),
-            ({"pull_request": {"number": "9"}}, "9"),
+            ({"number": 9}, 9),
+            ({"number": "9"}, 9),
+            ({"issue": {"number": 9}}, 9),
+            ({"pull_request": {"number": 9}}, 9),
         ],
     )
     def test_issue(
         self,
         environ: dict[str, str],
         event: dict[str, Any],
-        expected: str | None,
+        expected: int | None,
         mocker: MockerFixture,
         tmp_path: Path,
     ) -> None:
@@ -207,33 +367,6 @@ class TestGithubContext:
             GitHubContextIssue(repo.owner, repo.name, expected) if expected else None
         )
 
-    @pytest.mark.parametrize("job", [None, "test"])
-    def test_job(self, job: str | None, environ: dict[str, str]) -> None:
-        """Test job."""
-        if not job:
-            environ.pop("GITHUB_JOB", "")
-        else:
-            environ["GITHUB_JOB"] = job
-        assert GithubContext(environ=environ, event={"name": "foo"}).job == job
-
-    @pytest.mark.parametrize("ref", ["", "test"])
-    def test_ref(self, ref: str, environ: dict[str, str]) -> None:
-        """Test ref."""
-        if not ref:
-            environ.pop("GITHUB_REF", "")
-        else:
-            environ["GITHUB_REF"] = ref
-        assert GithubContext(environ=environ, event={"name": "foo"}).ref == ref
-
-    @pytest.mark.parametrize("ref_name", ["", "test"])
-    def test_ref_name(self, ref_name: str, environ: dict[str, str]) -> None:
-        """Test ref_name."""
-        if not ref_name:
-            environ.pop("GITHUB_REF_NAME", "")
-        else:
-            environ["GITHUB_REF_NAME"] = ref_name
-        assert GithubContext(environ=environ, event={"name": "foo"}).ref_name == ref_name
-
     @pytest.mark.parametrize("ref_protected", [False, True])
     def test_ref_protected(self, ref_protected: bool, environ: dict[str, str]) -> None:
         """Test ref_protected."""
@@ -243,16 +376,22 @@ class TestGithubContext:
             environ["GITHUB_REF_PROTECTED"] = str(ref_protected)
         assert GithubContext(environ=environ, event={"name": "foo"}).ref_protected is ref_protected
 
-    @pytest.mark.parametrize("ref_type", ["", "branch", "tag", "test"])
-    def test_ref_type(self, ref_type: str, environ: dict[str, str]) -> None:
-        """Test ref_type."""
-        if not ref_type:
-            environ.pop("GITHUB_REF_TYPE", "")
-        else:
-            environ["GITHUB_REF_TYPE"] = ref_type
-        assert GithubContext(environ=environ, event={"name": "foo"}).ref_type == (
-            ref_type or "branch"
-        )
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("", False),
+            ("0", False),
+            ("false", False),
+            ("1", True),
+            ("true", True),
+            ("TRUE", True),
+            ("yes", True),
+        ],
+    )
+    def test_ref_protected_value(self, value: str, expected: bool, environ: dict[str, str]) -> None:
+        """Test ref_protected with various values."""
+        environ["GITHUB_REF_PROTECTED"] = value
+        assert GithubContext(environ=environ, event={"name": "foo"}).ref_protected is expected
 
     @pytest.mark.parametrize(
         "repository", [None, GitHubContextRepo("user", "repo"), GitHubContextRepo("org", "repo")]
@@ -268,6 +407,13 @@ class TestGithubContext:
             environ["GITHUB_REPOSITORY"] = f"{repository.owner}/{repository.name}"
         assert GithubContext(environ=environ, event={"name": "foo"}).repository == repository
 
+    def test_repository_extra_separator(self, environ: dict[str, str]) -> None:
+        """Test repository with more than one separator."""
+        environ["GITHUB_REPOSITORY"] = "user/repo/extra"
+        assert GithubContext(
+            environ=environ, event={"name": "foo"}
+        ).repository == GitHubContextRepo("user", "repo/extra")
+
     def test_repository_from_event(self, environ: dict[str, str], test_fixture_dir: Path) -> None:
         """Test repository extracted from event payload."""
         environ.pop("GITHUB_REPOSITORY", None)
@@ -290,74 +436,6 @@ class TestGithubContext:
         mocker.patch.object(GithubContext, "repository", None)
         assert not GithubContext(environ=environ, event={"name": "foo"}).repository_url
 
-    @pytest.mark.parametrize("server_url", ["", "test"])
-    def test_server_url(self, server_url: str, environ: dict[str, str]) -> None:
-        """Test server_url."""
-        if not server_url:
-            environ.pop("GITHUB_SERVER_URL", "")
-        else:
-            environ["GITHUB_SERVER_URL"] = server_url
-        assert GithubContext(environ=environ, event={"name": "foo"}).server_url == (
-            server_url or "https://github.com"
-        )
-
-    @pytest.mark.parametrize("sha", ["", "test"])
-    def test_sha(self, sha: str, environ: dict[str, str]) -> None:
-        """Test sha."""
-        if not sha:
-            environ.pop("GITHUB_SHA", "")
-        else:
-            environ["GITHUB_SHA"] = sha
-        assert GithubContext(environ=environ, event={"name": "foo"}).sha == sha
-
-    @pytest.mark.parametrize("token", ["", "test"])
-    def test_token(self, token: str, environ: dict[str, str]) -> None:
-        """Test token."""
-        if not token:
-            environ.pop("GITHUB_TOKEN", "")
-        else:
-            environ["GITHUB_TOKEN"] = token
-        assert GithubContext(environ=environ, event={"name": "foo"}).token == token
-
-    @pytest.mark.parametrize("triggering_actor", ["", "test"])
-    def test_triggering_actor(self, triggering_actor: str, environ: dict[str, str]) -> None:
-        """Test triggering_actor."""
-        if not triggering_actor:
-            environ.pop("GITHUB_TRIGGERING_ACTOR", "")
-        else:
-            environ["GITHUB_TRIGGERING_ACTOR"] = triggering_actor
-        assert (
-            GithubContext(environ=environ, event={"name": "foo"}).triggering_actor
-            == triggering_actor
-        )
-
-    @pytest.mark.parametrize("workflow", ["", "test"])
-    def test_workflow(self, workflow: str, environ: dict[str, str]) -> None:
-        """Test workflow."""
-        if not workflow:
-            environ.pop("GITHUB_WORKFLOW", "")
-        else:
-            environ["GITHUB_WORKFLOW"] = workflow
-        assert GithubContext(environ=environ, event={"name": "foo"}).workflow == workflow
-
-    @pytest.mark.parametrize("workflow_ref", ["", "test"])
-    def test_workflow_ref(self, workflow_ref: str, environ: dict[str, str]) -> None:
-        """Test workflow_ref."""
-        if not workflow_ref:
-            environ.pop("GITHUB_WORKFLOW_REF", "")
-        else:
-            environ["GITHUB_WORKFLOW_REF"] = workflow_ref
-        assert GithubContext(environ=environ, event={"name": "foo"}).workflow_ref == workflow_ref
-
-    @pytest.mark.parametrize("workflow_sha", ["", "test"])
-    def test_workflow_sha(self, workflow_sha: str, environ: dict[str, str]) -> None:
-        """Test workflow_sha."""
-        if not workflow_sha:
-            environ.pop("GITHUB_WORKFLOW_SHA", "")
-        else:
-            environ["GITHUB_WORKFLOW_SHA"] = workflow_sha
-        assert GithubContext(environ=environ, event={"name": "foo"}).workflow_sha == workflow_sha
-
     def test_workspace(self, environ: dict[str, str], tmp_path: Path) -> None:
         """Test workspace."""
         environ["GITHUB_WORKSPACE"] = str(tmp_path)